@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import Optional
 from typing import Final
@@ -9,6 +10,28 @@ CONVERSION_TIME_60: int = 60
 CONVERSION_TIME_1000: int = 1000
 CONVERSION_TIME_100: int = 100
 
+# 毫秒位数 -> 补齐到三位的倍率（按位数下标取值，0位不会用到）
+# '5' 按 '500' 算，'50' 按 '500' 算，查表代替每次算幂
+MILLISECOND_DIGIT_SCALE: tuple[int, int, int, int] = (1, 100, 10, 1)
+
+
+def _rename_group_names(pattern_str: str, prefix: str) -> str:
+    """
+    中文：\n
+    给正则表达式字符串里所有的命名分组加上前缀 \n
+    多个模式的正则表达式合并成一个大的选择表达式时，分组名不能重复
+
+    English: \n
+    Prefix every named group in the regular expression string \n
+    Group names must be unique when the per-mode patterns
+    are merged into one big alternation
+
+    :param pattern_str: 正则表达式字符串 The regular expression string
+    :param prefix: 前缀 The prefix
+    :return: 改名后的正则表达式字符串 The renamed regular expression string
+    """
+    return pattern_str.replace("(?P<", f"(?P<{prefix}_")
+
 
 class Lyric_Time_tab:
     """
@@ -19,6 +42,16 @@ class Lyric_Time_tab:
     LRC Lyrics Format Time Tab Class
     """
 
+    # 实例属性固定，用 __slots__ 省去每个实例的 __dict__
+    # 一个歌词文件有成百上千个时间标签，每个实例的内存和属性读写开销都能省下来
+    __slots__ = ("original_time_tab", "time_tab",
+                 "brackets", "time_stamp",
+                 "match_result", "time_list",
+                 "minutes_str", "seconds_str", "milliseconds_str",
+                 "minutes_seconds_seperator", "seconds_milliseconds_seperator",
+                 "len_of_millisecond",
+                 "_default_time_tab_cache")
+
     # 尖括号正则表达式
     ANGLE_BRACKETS_REGREX: str = r'\<|\>'
     # 方括号正则表达式
@@ -42,7 +75,8 @@ class Lyric_Time_tab:
                                                                        r'(?P<seconds>\d{2})'
                                                                        r'(?P<seconds_milliseconds_seperator>\.)'
                                                                        r'(?P<milliseconds>\d{2})'
-                                                                       r'(?P<right_bracket>])')
+                                                                       r'(?P<right_bracket>])',
+                                                                       re.ASCII)
     # 普通模式时间标签的正则表达式
     TIME_TAB_EACH_LINE_NORMAL_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket>\[)'
                                                                        r'(?P<minutes>\d{2})'
@@ -50,7 +84,8 @@ class Lyric_Time_tab:
                                                                        r'(?P<seconds>\d{2})'
                                                                        r'(?P<seconds_milliseconds_seperator>[:.])'
                                                                        r'(?P<milliseconds>\d{2,3})'
-                                                                       r'(?P<right_bracket>])')
+                                                                       r'(?P<right_bracket>])',
+                                                                       re.ASCII)
 
     # 宽松模式时间标签的正则表达式
     TIME_TAB_EACH_LINE_LOOSE_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket>\[)'
@@ -59,7 +94,8 @@ class Lyric_Time_tab:
                                                                       r'(?P<seconds>\d*)'
                                                                       r'(?P<seconds_milliseconds_seperator>[:.])?'
                                                                       r'(?P<milliseconds>\d*)?'
-                                                                      r'(?P<right_bracket>])')
+                                                                      r'(?P<right_bracket>])',
+                                                                      re.ASCII)
     # 非常宽松模式时间标签的正则表达式
     TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket>\[)?'
                                                                            r'(?P<minutes>\d*)'
@@ -67,7 +103,8 @@ class Lyric_Time_tab:
                                                                            r'(?P<seconds>\d*)'
                                                                            r'(?P<seconds_milliseconds_seperator>[:.])?'
                                                                            r'(?P<milliseconds>\d*)?'
-                                                                           r'(?P<right_bracket>])?')
+                                                                           r'(?P<right_bracket>])?',
+                                                                           re.ASCII)
 
     # 正则表达式列表
     TIME_TAB_EACH_LINE_REGREX_LIST: list = [TIME_TAB_EACH_LINE_STRICT_REGREX,
@@ -83,7 +120,8 @@ class Lyric_Time_tab:
                                                                        r'(?P<seconds>\d{2})'
                                                                        r'(?P<seconds_milliseconds_seperator>\.)'
                                                                        r'(?P<milliseconds>\d{2})'
-                                                                       r'(?P<right_bracket>>)')
+                                                                       r'(?P<right_bracket>>)',
+                                                                       re.ASCII)
     # 普通模式时间标签的正则表达式
     TIME_TAB_EACH_WORD_NORMAL_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket><)'
                                                                        r'(?P<minutes>\d{2})'
@@ -91,7 +129,8 @@ class Lyric_Time_tab:
                                                                        r'(?P<seconds>\d{2})'
                                                                        r'(?P<seconds_milliseconds_seperator>[:.])'
                                                                        r'(?P<milliseconds>\d{2,3})'
-                                                                       r'(?P<right_bracket>>)')
+                                                                       r'(?P<right_bracket>>)',
+                                                                       re.ASCII)
     # 宽松模式时间标签的正则表达式
     TIME_TAB_EACH_WORD_LOOSE_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket><)'
                                                                       r'(?P<minutes>\d*)'
@@ -99,7 +138,8 @@ class Lyric_Time_tab:
                                                                       r'(?P<seconds>\d*)'
                                                                       r'(?P<seconds_milliseconds_seperator>[:.])?'
                                                                       r'(?P<milliseconds>\d*)?'
-                                                                      r'(?P<right_bracket>>)')
+                                                                      r'(?P<right_bracket>>)',
+                                                                      re.ASCII)
     # 非常宽松模式时间标签的正则表达式
     TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX: Final[Pattern[str]] = re.compile(r'(?P<left_bracket><)?'
                                                                            r'(?P<minutes>\d*)'
@@ -107,7 +147,8 @@ class Lyric_Time_tab:
                                                                            r'(?P<seconds>\d*)'
                                                                            r'(?P<seconds_milliseconds_seperator>[:.])?'
                                                                            r'(?P<milliseconds>\d*)?'
-                                                                           r'(?P<right_bracket>>)?')
+                                                                           r'(?P<right_bracket>>)?',
+                                                                           re.ASCII)
 
     # 正则表达式列表
     TIME_TAB_EACH_WORD_REGREX_LIST: list = [TIME_TAB_EACH_WORD_STRICT_REGREX,
@@ -115,6 +156,30 @@ class Lyric_Time_tab:
                                             TIME_TAB_EACH_WORD_LOOSE_REGREX,
                                             TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX]
 
+    # 所有模式的分支表 (分支分组名, 模式名, 对应的正则表达式)
+    # 从严格到非常宽松排列，合并后最左边的分支优先命中
+    TIME_TAB_ANY_MODE_BRANCHES: Final[tuple] = (
+        ("strict_line", "strict", TIME_TAB_EACH_LINE_STRICT_REGREX),
+        ("strict_word", "strict", TIME_TAB_EACH_WORD_STRICT_REGREX),
+        ("normal_line", "normal", TIME_TAB_EACH_LINE_NORMAL_REGREX),
+        ("normal_word", "normal", TIME_TAB_EACH_WORD_NORMAL_REGREX),
+        ("loose_line", "loose", TIME_TAB_EACH_LINE_LOOSE_REGREX),
+        ("loose_word", "loose", TIME_TAB_EACH_WORD_LOOSE_REGREX),
+        ("very_loose_line", "very_loose", TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX),
+        ("very_loose_word", "very_loose", TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX),
+    )
+
+    # 八个模式合并成一个大的选择表达式，一次 fullmatch 代替最多八次逐个尝试
+    # 每个分支外面包一层以分支命名的分组，命中了哪个分支，哪个分组就不是 None
+    _any_mode_pattern_parts: list = []
+    for _branch_name, _branch_mode, _branch_regex in TIME_TAB_ANY_MODE_BRANCHES:
+        _any_mode_pattern_parts.append(
+            f"(?P<{_branch_name}>{_rename_group_names(_branch_regex.pattern, _branch_name)})"
+        )
+    TIME_TAB_ANY_MODE_REGREX: Final[Pattern[str]] = re.compile("|".join(_any_mode_pattern_parts), re.ASCII)
+    # 清理类命名空间里的临时变量
+    del _any_mode_pattern_parts, _branch_name, _branch_mode, _branch_regex
+
     """
     接受一个时间标签字符串，分离出时间标签的各个部分
     """
@@ -150,6 +215,10 @@ class Lyric_Time_tab:
         # 时间标签毫秒位数
         self.len_of_millisecond = None
 
+        # 默认参数下格式化结果的缓存 (对应的时间戳, 格式化结果)
+        # 以时间戳为键，时间戳被修改后自动失效，不需要到处手动清空
+        self._default_time_tab_cache: Optional[tuple[float, str]] = None
+
         # 预分离时间标签
         if tab is not None:
             self.__pre_separating(tab, mode)
@@ -172,29 +241,45 @@ class Lyric_Time_tab:
     def __repr__(self):
         return self.time_list
 
+    # 取出对方的毫秒时间戳，供比较运算使用
+    # int 和 float 和算术运算一样按秒处理，转换为毫秒
+    @staticmethod
+    def __comparison_time_stamp(other):
+        if isinstance(other, Lyric_Time_tab):
+            return other.time_stamp
+        elif isinstance(other, (int, float)):
+            return other * CONVERSION_TIME_1000
+        else:
+            raise TypeError('unsupported comparison between \'TimeTab\' and \'{}\''.format(type(other)))
+
+    # 哈希值和相等判断保持一致，都基于时间戳
+    # 时间标签可以放进 set / dict 去重
+    def __hash__(self):
+        return hash(self.time_stamp)
+
     # 返回时间标签是否 == 另一个时间标签
     def __eq__(self, other):
-        return self.time_stamp == other.time_stamp
+        return self.time_stamp == Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 返回时间标签是否 < 于另一个时间标签
     def __lt__(self, other):
-        return self.time_stamp < other.time_stamp
+        return self.time_stamp < Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 返回时间标签是否 <= 另一个时间标签
     def __le__(self, other):
-        return self.time_stamp <= other.time_stamp
+        return self.time_stamp <= Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 返回时间标签是否 != 另一个时间标签
     def __ne__(self, other):
-        return self.time_stamp != other.time_stamp
+        return self.time_stamp != Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 返回时间标签是否 > 另一个时间标签
     def __gt__(self, other):
-        return self.time_stamp > other.time_stamp
+        return self.time_stamp > Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 返回时间标签是否 >= 另一个时间标签
     def __ge__(self, other):
-        return self.time_stamp >= other.time_stamp
+        return self.time_stamp >= Lyric_Time_tab.__comparison_time_stamp(other)
 
     # 加减乘除运算，返回时间标签时间戳
     def __add__(self, other):
@@ -203,7 +288,7 @@ class Lyric_Time_tab:
             self.time_stamp += other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp += other * CONVERSION_TIME_1000
             return self
         else:
@@ -215,7 +300,7 @@ class Lyric_Time_tab:
             self.time_stamp -= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp -= other * CONVERSION_TIME_1000
             return self
         else:
@@ -227,7 +312,7 @@ class Lyric_Time_tab:
             self.time_stamp *= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp *= other * CONVERSION_TIME_1000
             return self
         else:
@@ -239,7 +324,7 @@ class Lyric_Time_tab:
             self.time_stamp /= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp /= other * CONVERSION_TIME_1000
             return self
         else:
@@ -251,7 +336,7 @@ class Lyric_Time_tab:
             self.time_stamp //= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp //= other * CONVERSION_TIME_1000
             return self
         else:
@@ -263,7 +348,7 @@ class Lyric_Time_tab:
             self.time_stamp %= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp %= other * CONVERSION_TIME_1000
             return self
         else:
@@ -275,7 +360,7 @@ class Lyric_Time_tab:
             self.time_stamp **= other.time_stamp
             return self
         # 判断类型是否为 int 或者 float
-        elif isinstance(other, int) or isinstance(other, float):
+        elif isinstance(other, (int, float)):
             self.time_stamp **= other * CONVERSION_TIME_1000
             return self
         else:
@@ -302,6 +387,75 @@ class Lyric_Time_tab:
     def __rpow__(self, other):
         return self.__pow__(other)
 
+    """
+    定宽时间标签的快速解析
+    """
+
+    @staticmethod
+    def _parse_fixed_time_tab(tab: str, mode: str) -> Optional[tuple]:
+        """
+        中文： \n
+        严格和普通模式的时间标签是定宽格式（[00:00.00] 这样，毫秒两到三位），
+        直接按固定偏移取子串并校验，不经过正则引擎 \n
+        只认 ASCII 数字，认不出来返回 None，调用方回退到正则，行为不变
+
+        English: \n
+        Strict and normal mode tabs are fixed-width (like [00:00.00],
+        with two or three millisecond digits), so slice them at fixed
+        offsets and validate, without entering the regex engine \n
+        Only ASCII digits are accepted; anything unrecognized returns
+        None and the caller falls back to the regex, keeping behavior
+
+        :param tab: 时间标签 Time Tab
+        :param mode: 模式（strict 或 normal） Mode (strict or normal)
+        :return: 和正则分组顺序一致的元组，认不出来则为 None
+                 A tuple in regex group order, or None if unrecognized
+        """
+        length: int = len(tab)
+
+        # 毫秒两位长度是10，三位长度是11
+        if length != 10 and length != 11:
+            return None
+
+        left_bracket: str = tab[0]
+        right_bracket: str = tab[-1]
+
+        # 括号必须配对
+        if not ((left_bracket == '[' and right_bracket == ']')
+                or (left_bracket == '<' and right_bracket == '>')):
+            return None
+
+        minutes_seconds_seperator: str = tab[3]
+        seconds_milliseconds_seperator: str = tab[6]
+
+        # 分秒之间只能是冒号
+        if minutes_seconds_seperator != ':':
+            return None
+
+        # 严格模式毫秒只有两位，秒毫秒之间只能是点
+        if mode == 'strict':
+            if length != 10 or seconds_milliseconds_seperator != '.':
+                return None
+        # 普通模式允许冒号或者点
+        elif seconds_milliseconds_seperator != ':' and seconds_milliseconds_seperator != '.':
+            return None
+
+        minutes_str: str = tab[1:3]
+        seconds_str: str = tab[4:6]
+        milliseconds_str: str = tab[7:-1]
+
+        # 必须全是 ASCII 数字
+        # isdigit 单独用会放过全角数字等，交给正则慢速通道处理
+        if not (minutes_str.isascii() and minutes_str.isdigit()
+                and seconds_str.isascii() and seconds_str.isdigit()
+                and milliseconds_str.isascii() and milliseconds_str.isdigit()):
+            return None
+
+        return (left_bracket,
+                minutes_str, minutes_seconds_seperator,
+                seconds_str, seconds_milliseconds_seperator,
+                milliseconds_str, right_bracket)
+
     """
     预分离标签，判断是否合法，分离出时间标签的各个部分，储存到类的属性中，供其他方法调用
     私有方法
@@ -323,38 +477,53 @@ class Lyric_Time_tab:
         :return: None
         """
 
-        # 匹配时间标签
-        # 判断是否合法，并且判断类型
-        valid_with_type: list[bool, Optional[Pattern[str]]] = Lyric_Time_tab.is_valid_with_type(tab, mode)
+        # 各个部分，和正则表达式的分组顺序一致
+        # (左括号, 分钟, 分秒分隔符, 秒, 秒毫秒分隔符, 毫秒, 右括号)
+        groups: Optional[tuple] = None
+
+        # 快速通道
+        # 严格和普通模式的标签是定宽格式，直接按固定偏移取子串，不用进正则引擎
+        # 解析失败返回 None，照常走正则，行为不变
+        if mode == 'strict' or mode == 'normal':
+            groups = Lyric_Time_tab._parse_fixed_time_tab(tab, mode)
+
+        # 慢速通道（宽松模式，或者快速通道没认出来的输入）
+        if groups is None:
+            # 匹配时间标签
+            # 判断是否合法，并且判断类型
+            # 直接拿到匹配结果，不用再重新匹配一次
+            match_with_type: list[Optional[Match[str]], Optional[Pattern[str]]] \
+                = Lyric_Time_tab.match_with_type(tab, mode)
+
+            # 直接使用判断时拿到的匹配结果
+            # 不合法是 None，在下面统一报错
+            self.match_result = match_with_type[0]
+
+            if self.match_result is not None:
+                groups = self.match_result.groups()
 
         # 如果合法
-        if valid_with_type[0]:
-            # 利用返回的 判断出的 正则表达式 分离时间标签
-            self.match_result = valid_with_type[1].match(tab)
-            self.time_list = self.match_result.groups()
+        if groups is not None:
+            self.time_list = groups
+
+            # 先在本地变量上算好，再一次性写回属性
+            # 每次 self.xxx 的读写都是一次属性查找，热路径上能省则省
+            minutes_str: Optional[str] = groups[1]
+            seconds_str: Optional[str] = groups[3]
+            milliseconds_str: Optional[str] = groups[5]
 
             # 添加到类的属性中
-            self.brackets = self.match_result.group("left_bracket") + self.match_result.group("right_bracket")
-            self.minutes_str = self.match_result.group("minutes")
+            self.brackets = groups[0] + groups[6]
             # 如果有分钟位，分钟位不足两位，左边补零
-            self.minutes_str = self.minutes_str.rjust(2, '0')
-            self.minutes_seconds_seperator = self.match_result.group("minutes_seconds_seperator")
+            minutes_str = minutes_str.rjust(2, '0')
+            self.minutes_str = minutes_str
+            self.minutes_seconds_seperator = groups[2]
 
-            self.seconds_str = self.match_result.group("seconds")
             # 如果有秒位，秒位不足两位，左边补零
-            self.seconds_str = self.seconds_str.rjust(2, '0')
-
-            self.seconds_milliseconds_seperator = self.match_result.group("seconds_milliseconds_seperator")
-            # 如果有毫秒位，毫秒位不足三位，右边补零
-            self.milliseconds_str = self.match_result.group("milliseconds")
+            seconds_str = seconds_str.rjust(2, '0')
+            self.seconds_str = seconds_str
 
-            # 如果有毫秒位，毫秒位不足三位，右边补零
-            if self.milliseconds_str is not None:
-                self.len_of_millisecond = len(self.milliseconds_str)
-                self.milliseconds_str = self.milliseconds_str.ljust(3, '0')
-            else:
-                # 原先就是None，不用管
-                pass
+            self.seconds_milliseconds_seperator = groups[4]
 
             # 自动计算时间戳
             # 要考虑没有(None)的情况
@@ -363,26 +532,55 @@ class Lyric_Time_tab:
             seconds_int: int
             milliseconds_int: int
 
-            if self.minutes_str is not None:
-                minutes_int = int(self.minutes_str)
+            # 如果有毫秒位，毫秒位不足三位，右边补零
+            if milliseconds_str is not None:
+                len_of_millisecond: int = len(milliseconds_str)
+                self.len_of_millisecond = len_of_millisecond
+
+                # 毫秒整数直接用原始数字查表乘倍率
+                # 不足三位等价于右边补零（'5' 按 500 算），不用解析补零后的字符串
+                if len_of_millisecond == 0:
+                    milliseconds_int = 0
+                elif len_of_millisecond < 3:
+                    milliseconds_int = int(milliseconds_str) * MILLISECOND_DIGIT_SCALE[len_of_millisecond]
+                else:
+                    milliseconds_int = int(milliseconds_str)
+
+                milliseconds_str = milliseconds_str.ljust(3, '0')
+            else:
+                # 原先就是None，不用管
+                milliseconds_int = 0
+            self.milliseconds_str = milliseconds_str
+
+            if minutes_str is not None:
+                # 两位数字直接用 ord 算术解码，绕过通用的字符串转整数
+                # 宽松模式下可能超过两位，回退到 int()
+                if len(minutes_str) == 2:
+                    minutes_int = (ord(minutes_str[0]) - 48) * 10 + (ord(minutes_str[1]) - 48)
+                else:
+                    minutes_int = int(minutes_str)
             else:
                 minutes_int = 0
 
-            if self.seconds_str is not None:
-                seconds_int = int(self.seconds_str)
+            if seconds_str is not None:
+                # 同上，两位数字用 ord 算术解码
+                if len(seconds_str) == 2:
+                    seconds_int = (ord(seconds_str[0]) - 48) * 10 + (ord(seconds_str[1]) - 48)
+                else:
+                    seconds_int = int(seconds_str)
             else:
                 seconds_int = 0
 
-            if self.milliseconds_str is not None:
-                milliseconds_int = int(self.milliseconds_str)
-            else:
-                milliseconds_int = 0
-
             # 调用函数，计算时间戳
             self.time_stamp = Lyric_Time_tab.calculate_time_stamp(minutes_int, seconds_int, milliseconds_int)
 
             # print(self.time_stamp)
 
+            # 需要的部分都提取完了，释放匹配对象
+            # Match 对象会钉住源字符串和分组位置信息，成千上万个标签一起留着很占内存
+            # 需要内省的场合可以重新 match_with_type 一次
+            self.match_result = None
+
         # 如果不合法
         else:
             # 报错
@@ -430,49 +628,86 @@ class Lyric_Time_tab:
                   括号正则表达式常量 Bracket Regular Expression Constant]
         """
 
+        # 直接调用匹配方法，丢弃匹配结果，只返回是否合法和正则表达式
+        match_with_type: list[Optional[Match[str]], Optional[Pattern[str]]] = cls.match_with_type(tab, mode)
+
+        # 如果匹配成功，合法
+        if match_with_type[0] is not None:
+            return [True, match_with_type[1]]
+        else:
+            return [False, None]
+
+    """
+    匹配时间标签，并且判断类型
+    """
+
+    @classmethod
+    def match_with_type(cls, tab: str, mode: str = 'normal') -> list[Optional[Match[str]], Optional[Pattern[str]]]:
+        """
+        中文： \n
+        匹配时间标签，并且判断类型 \n
+        和 is_valid_with_type 一样的四种模式和判断逻辑，
+        但是直接返回匹配结果，匹配一次就够，不用调用方再匹配一次 \n
+            如果匹配成功，返回[匹配结果, 对应的正则表达式常量] \n
+            如果不匹配，返回[None, None]
+
+        English: \n
+        Match the time label and determine the type \n
+        Same four modes and logic as is_valid_with_type,
+        but the match result itself is returned,
+        so one match is enough and the caller does not match again \n
+            If matched, return [match result, regular expression constant] \n
+            If not matched, return [None, None]
+
+        :param tab: 时间标签 Time Tab
+        :param mode: 模式 Mode
+        :return: [匹配结果 Match result,
+                  括号正则表达式常量 Bracket Regular Expression Constant]
+        """
+
         # 严格模式
         if mode == 'strict':
             # 每行的
-            if re.match(cls.TIME_TAB_EACH_LINE_STRICT_REGREX, tab):
-                return [True, Lyric_Time_tab.TIME_TAB_EACH_LINE_STRICT_REGREX]
+            if match_result := cls.TIME_TAB_EACH_LINE_STRICT_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_LINE_STRICT_REGREX]
             # 每个字的
-            elif re.match(cls.TIME_TAB_EACH_WORD_STRICT_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_WORD_STRICT_REGREX]
+            elif match_result := cls.TIME_TAB_EACH_WORD_STRICT_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_WORD_STRICT_REGREX]
             else:
-                return [False, None]
+                return [None, None]
 
         # 普通模式
         elif mode == 'normal':
             # 每行的
-            if re.match(cls.TIME_TAB_EACH_LINE_NORMAL_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_LINE_NORMAL_REGREX]
+            if match_result := cls.TIME_TAB_EACH_LINE_NORMAL_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_LINE_NORMAL_REGREX]
             # 每个字的
-            elif re.match(cls.TIME_TAB_EACH_WORD_NORMAL_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_WORD_NORMAL_REGREX]
+            elif match_result := cls.TIME_TAB_EACH_WORD_NORMAL_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_WORD_NORMAL_REGREX]
             else:
-                return [False, None]
+                return [None, None]
 
         # 宽松模式
         elif mode == 'loose':
             # 每行的
-            if re.match(cls.TIME_TAB_EACH_LINE_LOOSE_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_LINE_LOOSE_REGREX]
+            if match_result := cls.TIME_TAB_EACH_LINE_LOOSE_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_LINE_LOOSE_REGREX]
             # 每个字的
-            elif re.match(cls.TIME_TAB_EACH_WORD_LOOSE_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_WORD_LOOSE_REGREX]
+            elif match_result := cls.TIME_TAB_EACH_WORD_LOOSE_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_WORD_LOOSE_REGREX]
             else:
-                return [False, None]
+                return [None, None]
 
         # 非常宽松模式
         elif mode == 'very_loose':
             # 每行的
-            if re.match(cls.TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX]
+            if match_result := cls.TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX]
             # 每个字的
-            elif re.match(cls.TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX, tab):
-                return [True, cls.TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX]
+            elif match_result := cls.TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX.fullmatch(tab):
+                return [match_result, cls.TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX]
             else:
-                return [False, None]
+                return [None, None]
 
         # 模式错误
         else:
@@ -480,6 +715,134 @@ class Lyric_Time_tab:
             # input is "mode变量的值", must be strict, normal, loose or very_loose
             raise ValueError(f'input is "{mode}", must be strict, normal, loose or very_loose')
 
+    """
+    批量解析文本中的所有时间标签
+    """
+
+    @classmethod
+    def parse_many(cls, text: str, mode: str = 'normal', each_word: bool = False) -> list[float]:
+        """
+        中文： \n
+        一次扫描整段文本，批量解析其中所有的时间标签，返回毫秒时间戳列表 \n
+        只需要时间戳的调用方不用逐个构造 Lyric_Time_tab 实例，
+        正则引擎的启动开销也只花一次，摊到每个标签上 \n
+        默认找每行的 [] 标签，each_word 为 True 时找每个字的 <> 标签
+
+        English: \n
+        Scan the whole text once and batch-parse every time tab in it,
+        returning a list of millisecond time stamps \n
+        Callers that only need time stamps do not have to construct a
+        Lyric_Time_tab instance per tab, and the regex engine setup
+        cost is paid once and amortized over all tags \n
+        By default the per-line [] tabs are searched;
+        with each_word True the per-word <> tabs are searched
+
+        :param text: 文本 The text
+        :param mode: 模式 Mode
+        :param each_word: 是否找每个字的标签 Whether to search per-word tabs
+        :return: 毫秒时间戳列表 The millisecond time stamp list
+        """
+
+        # 按模式取对应的正则表达式
+        pattern: Pattern[str]
+
+        if mode == 'strict':
+            pattern = cls.TIME_TAB_EACH_WORD_STRICT_REGREX if each_word else cls.TIME_TAB_EACH_LINE_STRICT_REGREX
+        elif mode == 'normal':
+            pattern = cls.TIME_TAB_EACH_WORD_NORMAL_REGREX if each_word else cls.TIME_TAB_EACH_LINE_NORMAL_REGREX
+        elif mode == 'loose':
+            pattern = cls.TIME_TAB_EACH_WORD_LOOSE_REGREX if each_word else cls.TIME_TAB_EACH_LINE_LOOSE_REGREX
+        elif mode == 'very_loose':
+            pattern = cls.TIME_TAB_EACH_WORD_VERY_LOOSE_REGREX if each_word \
+                else cls.TIME_TAB_EACH_LINE_VERY_LOOSE_REGREX
+        else:
+            # 引发异常, 模式错误
+            raise ValueError(f'input is "{mode}", must be strict, normal, loose or very_loose')
+
+        # 输出列表
+        output_list: list[float] = []
+        output_list_append = output_list.append
+
+        # 整段文本只扫描一次
+        for match_result in pattern.finditer(text):
+            # 一次 groups() 调用按位置解包
+            # 不用三次按名字查找分组
+            (_left_bracket, minutes_str, _seperator_1,
+             seconds_str, _seperator_2,
+             milliseconds_str, _right_bracket) = match_result.groups()
+
+            # 缺失的部分按 0 处理（宽松模式可能缺毫秒）
+            minutes_int: int = int(minutes_str) if minutes_str else 0
+            seconds_int: int = int(seconds_str) if seconds_str else 0
+            # 毫秒不足三位，右边补零，和实例解析保持一致
+            milliseconds_int: int = int(milliseconds_str.ljust(3, '0')) if milliseconds_str else 0
+
+            output_list_append(cls.calculate_time_stamp(minutes_int, seconds_int, milliseconds_int))
+
+        return output_list
+
+    """
+    不知道模式时自动判断并解析时间标签
+    """
+
+    @classmethod
+    def parse_auto(cls, tab: str) -> Self:
+        """
+        中文： \n
+        不知道标签用的是哪个模式时，用合并后的大正则表达式一次 fullmatch
+        自动判断模式，再按该模式解析，返回时间标签对象 \n
+        不用从严格到宽松逐个模式试，最多八次匹配变成一次 \n
+        多个模式都能匹配时，最左边（最严格）的分支优先
+
+        English: \n
+        When the mode of a tab is unknown, one fullmatch against the
+        combined alternation pattern determines the mode, and the tab
+        is then parsed under that mode and returned as a tab object \n
+        This replaces trying up to eight patterns one by one with a
+        single match \n
+        When several modes match, the leftmost (strictest) branch wins
+
+        :param tab: 时间标签 Time Tab
+        :return: 时间标签对象 The time tab object
+        """
+        match_result: Optional[Match[str]] = cls.TIME_TAB_ANY_MODE_REGREX.fullmatch(tab)
+
+        # 所有模式都不匹配
+        if match_result is None:
+            raise ValueError(f"The time original_tab {tab} is not valid under any mode")
+
+        # 看哪个分支的分组命中，取对应的模式
+        for branch_name, branch_mode, _branch_regex in cls.TIME_TAB_ANY_MODE_BRANCHES:
+            if match_result.group(branch_name) is not None:
+                return cls(tab, branch_mode)
+
+        # fullmatch 成功必然有分支命中，防御性兜底
+        raise ValueError(f"The time original_tab {tab} is not valid under any mode")
+
+    """
+    扫描一行文本中所有模式的时间标签
+    """
+
+    @classmethod
+    def find_all_tabs(cls, line: str) -> list[Match[str]]:
+        """
+        中文： \n
+        用合并后的大正则表达式扫描一行文本，
+        返回所有时间标签的匹配结果列表 \n
+        不管标签是哪个模式、是每行的还是每个字的，一次扫描全部找到，
+        不用每个模式各扫一遍
+
+        English: \n
+        Scan a line of text with the combined alternation pattern and
+        return the match result list of every time tab in it \n
+        Tabs of any mode, per-line or per-word, are all found in one
+        scan instead of one scan per pattern
+
+        :param line: 一行文本 A line of text
+        :return: 匹配结果列表 The match result list
+        """
+        return list(cls.TIME_TAB_ANY_MODE_REGREX.finditer(line))
+
     """
     计算时间戳，分、秒、毫秒，小时（可选）
     返回毫秒位单位的时间戳(3位)
@@ -586,57 +949,13 @@ class Lyric_Time_tab:
         :param seperator: 分隔符 The seperator
         :return: 时间标签 The time tag
         """
-        minutes_int: int
-        seconds_int: int
-        millisecond_int: int | float
-
-        minutes_str: str
-        seconds_str: str
-        millisecond_str: str
-
-        time_tab_output: str
-
-        # 计算分秒毫秒，输入的时间戳是len_of_millisecond位相关的
-        minutes_int = time_stamp // (10 ** len_of_millisecond_inputted) // 60
-        seconds_int = time_stamp // (10 ** len_of_millisecond_inputted) % 60
-        millisecond_int = time_stamp * (10 ** (3 - len_of_millisecond_inputted)) % 1000
-
-        # 转为字符串
-        # 分
-        minutes_str = str(minutes_int)
-        # 补位
-        # 不足则左边补0
-        minutes_str = minutes_str.rjust(2, "0")
-
-        # 秒
-        seconds_str = str(seconds_int)
-        # 补位
-        # 不足则左边补0
-        seconds_str = seconds_str.rjust(2, "0")
-
-        # 毫秒
-        # 如果有小数位，抹去小数位
-        millisecond_int = int(millisecond_int)
-        # 转为字符串
-        millisecond_str = str(millisecond_int)
-        # 输出的毫秒位长度
-        # 不足则右边补0
-        millisecond_str = millisecond_str.ljust(len_of_millisecond_output, "0")
-        # 截取
-        millisecond_str = millisecond_str[:len_of_millisecond_output]
-
-        # 加上 左右括号 和 分隔符
-        # 格式化字符串
-        time_tab_output = f"{brackets[0]}" \
-                          f"{minutes_str}" \
-                          f"{seperator[0]}" \
-                          f"{seconds_str}" \
-                          f"{seperator[1]}" \
-                          f"{millisecond_str}" \
-                          f"{brackets[1]}"
-
-        # 返回最终结果
-        return time_tab_output
+        # 转发到模块级缓存函数
+        # 参数全部可哈希，同样的时间戳和格式参数只格式化一次
+        return _convert_time_stamp_to_time_tab_cached(time_stamp,
+                                                      len_of_millisecond_inputted,
+                                                      len_of_millisecond_output,
+                                                      brackets,
+                                                      seperator)
 
     def convert_to_time_tab(self,
                             len_of_millisecond_inputted: int = 3,
@@ -660,12 +979,79 @@ class Lyric_Time_tab:
         # 如果time stamp是None，返回空字符串，表明没有时间标签
         if self.time_stamp is None:
             return ""
-        else:
-            return Lyric_Time_tab.convert_time_stamp_to_time_tab_static(self.time_stamp,
-                                                                        len_of_millisecond_inputted,
-                                                                        len_of_millisecond_output,
-                                                                        brackets,
-                                                                        seperator)
+
+        # 是否全是默认参数（最常见的调用方式）
+        whether_default_arguments: bool = (len_of_millisecond_inputted == 3
+                                           and len_of_millisecond_output == 2
+                                           and brackets == ("[", "]")
+                                           and seperator == (":", "."))
+
+        # 默认参数下，先查缓存，时间戳没变就直接返回
+        if whether_default_arguments:
+            if (self._default_time_tab_cache is not None
+                    and self._default_time_tab_cache[0] == self.time_stamp):
+                return self._default_time_tab_cache[1]
+
+        output_time_tab: str = Lyric_Time_tab.convert_time_stamp_to_time_tab_static(self.time_stamp,
+                                                                                    len_of_millisecond_inputted,
+                                                                                    len_of_millisecond_output,
+                                                                                    brackets,
+                                                                                    seperator)
+
+        # 默认参数下，存入缓存
+        if whether_default_arguments:
+            self._default_time_tab_cache = (self.time_stamp, output_time_tab)
+
+        return output_time_tab
+
+    """
+    批量将时间戳格式化为时间标签
+    """
+
+    @classmethod
+    def format_many(cls,
+                    time_stamps: list[int | float],
+                    len_of_millisecond_inputted: int = 3,
+                    len_of_millisecond_output: int = 2,
+                    brackets: tuple[str, str] = ("[", "]"),
+                    seperator: tuple[str, str] = (":", ".")) -> list[str]:
+        """
+        中文：\n
+        批量将时间戳列表格式化为时间标签列表 \n
+        格式参数只检查一次，循环内只剩缓存函数调用和列表追加，
+        整首歌统一移调、统一导出时不用逐个调用静态方法 \n
+        重复出现的时间戳直接命中格式化缓存
+
+        English: \n
+        Batch-format a list of time stamps into a list of time tabs \n
+        The format arguments are resolved once; inside the loop only the
+        cached formatting call and a list append remain, so exporting or
+        re-timing a whole song does not pay the per-call static method
+        overhead \n
+        Repeated time stamps hit the formatting cache directly
+
+        :param time_stamps: 时间戳列表 The time stamp list
+        :param len_of_millisecond_inputted: 输入的时间戳的毫秒位的位数 The number of milliseconds_str of the input time stamps
+        :param len_of_millisecond_output: 输出的时间戳的毫秒位的位数 The number of milliseconds_str of the output time tabs
+        :param brackets: 括号 The brackets
+        :param seperator: 分隔符 The seperator
+        :return: 时间标签列表 The time tab list
+        """
+        # 输出列表
+        output_list: list[str] = []
+        output_list_append = output_list.append
+
+        # 循环内直接调用模块级缓存函数，省去每次的类属性查找
+        format_one = _convert_time_stamp_to_time_tab_cached
+
+        for time_stamp in time_stamps:
+            output_list_append(format_one(time_stamp,
+                                          len_of_millisecond_inputted,
+                                          len_of_millisecond_output,
+                                          brackets,
+                                          seperator))
+
+        return output_list
 
     # 返回自身
     def shift_time(self,
@@ -690,27 +1076,59 @@ class Lyric_Time_tab:
         # 转毫秒位为3位（规范化）
         milliseconds = int(milliseconds * (10 ** (3 - len_of_millisecond)))
 
-        # 修改属性
-        self.minutes_str += minutes
-        self.seconds_str += seconds
-        self.milliseconds_str += milliseconds
+        # 偏移量先合成一个毫秒整数，一次加到时间戳上
+        # 原实现逐个对字符串属性 += 整数，既是类型错误也做了三份重复工作
+        time_stamp_shift: float = Lyric_Time_tab.calculate_time_stamp(minutes, seconds, milliseconds)
+
+        # 委托给毫秒版本
+        self.shift_time_ms(time_stamp_shift)
 
-        # 修改时间列表
-        self.time_list[1] += minutes
-        self.time_list[3] += seconds
-        self.time_list[5] += milliseconds
+        return self
 
-        # 计算时间戳
-        time_stamp_shift: float = Lyric_Time_tab.calculate_time_stamp(minutes, seconds, milliseconds)
+    # 批量移动用的毫秒版本，不返回自身
+    def shift_time_ms(self, milliseconds: int) -> None:
+        """
+        中文：\n
+        将时间标签移动给定的毫秒数 \n
+        批量移动（比如整个文件偏移）时，调用方在循环外把分秒毫秒
+        换算成一个毫秒数，循环里每次只做一次整数加法和字段重算 \n
+        shift_time 是这个方法的换算包装
 
+        English: \n
+        Move the time tag by the given number of milliseconds \n
+        For bulk shifting (e.g. offsetting a whole file), the caller
+        converts minutes/seconds/milliseconds to one millisecond count
+        outside the loop, leaving one integer add and the field rebuild
+        per iteration \n
+        shift_time is a converting wrapper around this method
+
+        :param milliseconds: 毫秒数 The number of milliseconds_str
+        :return: None
+        """
         # 移动时间戳
-        self.time_stamp += time_stamp_shift
+        self.time_stamp += milliseconds
+
+        # 按新时间戳重算分秒毫秒字符串，商和余数用 divmod 一起拿
+        total_seconds_int, milliseconds_int = divmod(int(self.time_stamp), CONVERSION_TIME_1000)
+        minutes_int, seconds_int = divmod(total_seconds_int, CONVERSION_TIME_60)
+
+        self.minutes_str = str(minutes_int).rjust(2, '0')
+        self.seconds_str = str(seconds_int).rjust(2, '0')
+        self.milliseconds_str = str(milliseconds_int).rjust(3, '0')
+
+        # 时间列表按分组顺序重建（元组不可变，不能原地改）
+        if self.time_list is not None:
+            self.time_list = (self.time_list[0],
+                              self.minutes_str,
+                              self.time_list[2],
+                              self.seconds_str,
+                              self.time_list[4],
+                              self.milliseconds_str,
+                              self.time_list[6])
 
         # 修改时间标签
         self.time_tab = self.convert_to_time_tab()
 
-        return self
-
     # 返回自身
     def format_time_tab_self(self,
                              brackets: Optional[tuple[str, str]],
@@ -819,6 +1237,64 @@ class Lyric_Time_tab:
         return self.original_time_tab.isspace()
 
 
+"""
+模块级缓存函数
+时间标签格式化是纯函数，参数全部可哈希
+放在模块层，lru_cache不用处理类方法的描述符
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _convert_time_stamp_to_time_tab_cached(time_stamp: int | float,
+                                           len_of_millisecond_inputted: int,
+                                           len_of_millisecond_output: int,
+                                           brackets: tuple[str, str],
+                                           seperator: tuple[str, str]) -> str:
+    """
+    中文：\n
+    convert_time_stamp_to_time_tab_static 的缓存实现 \n
+    歌词文件里同样的时间戳和格式参数会反复出现，格式化一次之后直接查表
+
+    English: \n
+    The cached implementation of convert_time_stamp_to_time_tab_static \n
+    The same time stamp and format arguments recur in a lyric file,
+    so each combination is formatted once and then looked up
+
+    :param time_stamp: 时间戳 The time stamp
+    :param len_of_millisecond_inputted: 输入的时间戳的毫秒位的位数 The number of milliseconds_str of the input time stamp
+    :param len_of_millisecond_output: 输出的时间戳的毫秒位的位数 The number of milliseconds_str of the output time stamp
+    :param brackets: 括号 The brackets
+    :param seperator: 分隔符 The seperator
+    :return: 时间标签 The time tag
+    """
+    minutes_int: int
+    seconds_int: int
+    millisecond_int: int
+    millisecond_str: str
+
+    # 计算分秒毫秒，输入的时间戳是len_of_millisecond位相关的
+    # 商和余数一起要，用 divmod 一次算完，不做两次除法
+    # 如果有小数位，抹去小数位
+    total_seconds_int, fractional_second = divmod(time_stamp, 10 ** len_of_millisecond_inputted)
+    minutes_int, seconds_int = divmod(int(total_seconds_int), 60)
+    millisecond_int = int(fractional_second * (10 ** (3 - len_of_millisecond_inputted)) % 1000)
+
+    # 毫秒
+    # 输出的毫秒位长度，不足则右边补0，再截取
+    # 注意是右边补零和截取（取高位），不能用左边补零的格式化写法代替
+    millisecond_str = str(millisecond_int).ljust(len_of_millisecond_output, "0")[:len_of_millisecond_output]
+
+    # 加上 左右括号 和 分隔符
+    # 分秒直接用格式化位宽左边补零，一次分配，不经过 str() + rjust 两次分配
+    return f"{brackets[0]}" \
+           f"{minutes_int:02d}" \
+           f"{seperator[0]}" \
+           f"{seconds_int:02d}" \
+           f"{seperator[1]}" \
+           f"{millisecond_str}" \
+           f"{brackets[1]}"
+
+
 """
 中文：\n
 测试内容
@@ -1,19 +1,62 @@
-from collections import UserString
+import re
+from array import array
+from bisect import bisect_right
+from functools import total_ordering
 from .Lyric_Time_tab import Lyric_Time_tab
 from typing import Optional, Union
 
 """
-每个字符的类，继承自字符串类，
+每个字符的类，
 包含时间和字符
 """
 
 
-class Lyric_character(UserString):
+def _merge_unicode_ranges(ranges: tuple[tuple[int, int], ...]) -> tuple[tuple[int, int], ...]:
+    """
+    中文：\n
+    合并重叠或相邻的 Unicode 区间 \n
+    先按起点排序，然后逐个合并（下一个区间的起点 <= 当前区间的终点 + 1 即可合并）
+
+    English: \n
+    Merge overlapping or adjacent Unicode ranges \n
+    Sort by start point first, then coalesce one by one
+    (merge when next.start <= current.end + 1)
+
+    :param ranges: 原始区间列表 The original range list
+    :return: 合并后的区间元组 The merged range tuple
+    """
+    merged: list[tuple[int, int]] = []
+
+    for start, end in sorted(ranges):
+        # 与上一个区间重叠或相邻，合并
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        # 否则作为新区间加入
+        else:
+            merged.append((start, end))
+
+    return tuple(merged)
+
+
+# 每个码位的判断结果缓存
+# 歌词中同样的字符会反复出现（的、我、你……），缓存后只需一次字典查找
+_CJKV_MEMO: dict[int, bool] = {}
+
+
+# 只定义 __eq__ 和 __lt__，其余比较运算符由 total_ordering 自动生成
+# 不用手写四个转发方法，各做两次派发
+@total_ordering
+class Lyric_character:
+
+    # 只有字符和时间两个属性，用 __slots__ 省去每个实例的 __dict__
+    # 歌词文件动辄几千个字符，每个实例省下的内存和属性查找开销都很可观
+    __slots__ = ("data", "time_tab")
 
     # CJKV 汉字字符集Unicode编码范围
     # 汉字和喃字的 Unicode 区间
-    # 在原有的列表后面追加新的元组
-    CHINESE_OR_CHU_NOM_RANGES: list[tuple[int, int]] = [
+    # 在原有的元组后面追加新的元组
+    # 元组不可变，防止运行时被意外修改，导致和排序好的查找表不一致
+    CHINESE_OR_CHU_NOM_RANGES: tuple[tuple[int, int], ...] = (
         (0x2E80, 0x2EFF),  # CJK 部首补充
         (0x2F00, 0x2FDF),  # 康熙部首
         (0x3007, 0x3007),  # 〇
@@ -31,20 +74,72 @@ class Lyric_character(UserString):
         (0x20120, 0x20120),  # 多字叠字符号𠄠
         (0x16FE3, 0x16FE3),  # 多字叠字符号𖿣
         (0x2E80, 0x2E80)  # ⺀
-    ]
+    )
+
+    # 合并重叠或相邻区间后的区间表，互不重叠，按起点排序，供二分查找使用
+    # 原始的 CHINESE_OR_CHU_NOM_RANGES 保留给人类阅读
+    CHINESE_OR_CHU_NOM_RANGES_MERGED: tuple[tuple[int, int], ...] = _merge_unicode_ranges(CHINESE_OR_CHU_NOM_RANGES)
+    # 合并后的区间起点表
+    # 用 array 连续储存无符号整数，不是装箱的 Python int 列表，更省内存也更贴近缓存
+    CHINESE_OR_CHU_NOM_RANGE_STARTS: array = array('I', [start for start, end in CHINESE_OR_CHU_NOM_RANGES_MERGED])
+    # 合并后的区间终点表
+    CHINESE_OR_CHU_NOM_RANGE_ENDS: array = array('I', [end for start, end in CHINESE_OR_CHU_NOM_RANGES_MERGED])
+
+    # 由合并后的区间生成的字符类正则表达式 [⺀-〻...]
+    # 正则引擎在 C 层做字符类成员测试，适合整行批量扫描
+    CHINESE_OR_CHU_NOM_CHARACTER_REGEX: re.Pattern = re.compile(
+        "[" + "".join(f"\\U{start:08X}-\\U{end:08X}" for start, end in CHINESE_OR_CHU_NOM_RANGES_MERGED) + "]"
+    )
 
     """
     重写init，添加时间属性
     """
 
     def __init__(self, character: str, time_tab: Optional[Lyric_Time_tab] = None):
-        self.initial_data: str = character
-        super().__init__(character)
+        # 字符本身
+        self.data: str = str(character)
 
         # 时间
         # 调用Time_tab类
         self.time_tab: Optional[Lyric_Time_tab] = time_tab
 
+    # 兼容属性，字符本身已经存在 data 里，不再重复储存一份
+    @property
+    def initial_data(self) -> str:
+        return self.data
+
+    # 只实现实际用到的字符串协议方法
+    # 不再继承 UserString，避免每个字符串操作都经过 Python 层转发
+    def __str__(self) -> str:
+        return self.data
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __eq__(self, other) -> bool:
+        # 和另一个字符对象比较，或者直接和字符串比较
+        if isinstance(other, Lyric_character):
+            return self.data == other.data
+        elif isinstance(other, str):
+            return self.data == other
+        else:
+            return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        # 和另一个字符对象比较，或者直接和字符串比较
+        if isinstance(other, Lyric_character):
+            return self.data < other.data
+        elif isinstance(other, str):
+            return self.data < other
+        else:
+            return NotImplemented
+
     @staticmethod
     def is_chinese_or_chu_nom_or_chinese_radical_staticmethod(single_character: Optional[str]) -> bool:
         # print(single_character, type(single_character))
@@ -52,19 +147,90 @@ class Lyric_character(UserString):
             return False
 
         char_code: int = ord(single_character)  # 获取字符的 Unicode 编码
-        start: int
-        end: int
-        for start, end in Lyric_character.CHINESE_OR_CHU_NOM_RANGES:
-            if start <= char_code <= end:  # 判断字符编码是否在汉字或喃字的 Unicode 区间内
-                return True  # 如果在区间内，返回 True
-        return False  # 如果不在任何区间内，返回 False
+
+        # ASCII 快速通道
+        # 歌词中大量出现空格、标点、拉丁字母，都在 U+0000-U+00FF 内
+        # 没有任何汉字或喃字区间与之相交，直接返回 False，不用二分查找
+        if char_code < 0x100:
+            return False
+
+        # 查缓存，命中直接返回
+        cached_result: Optional[bool] = _CJKV_MEMO.get(char_code)
+        if cached_result is not None:
+            return cached_result
+
+        # 二分查找，找到最后一个起点小于等于字符编码的区间
+        # O(logN)，区间数量多时比逐个遍历快
+        range_index: int = bisect_right(Lyric_character.CHINESE_OR_CHU_NOM_RANGE_STARTS, char_code) - 1
+
+        # 起点都大于字符编码，不在任何区间内
+        # 否则判断字符编码是否在该区间的终点之内
+        result: bool = range_index >= 0 and char_code <= Lyric_character.CHINESE_OR_CHU_NOM_RANGE_ENDS[range_index]
+
+        # 存入缓存
+        _CJKV_MEMO[char_code] = result
+
+        return result
+
+    @classmethod
+    def classify_string_classmethod(cls, string: str) -> list[bool]:
+        """
+        中文：\n
+        批量判断字符串的每个字符是否为汉字或喃字 \n
+        整串交给字符类正则表达式扫描，
+        比逐字调用判断方法省去每个字符的 Python 层调用开销
+
+        English: \n
+        Batch-classify every character of the string
+        as CJKV (Chinese or Chu Nom) or not \n
+        The whole string is scanned by the character-class
+        regular expression, avoiding a Python-level call per character
+
+        :param string: 字符串 The string
+        :return: 每个字符是否为汉字或喃字的列表 The per-character CJKV flag list
+        """
+        # 先全部置 False，再把正则匹配到的位置置 True
+        result: list[bool] = [False] * len(string)
+
+        for matched_character in cls.CHINESE_OR_CHU_NOM_CHARACTER_REGEX.finditer(string):
+            result[matched_character.start()] = True
+
+        return result
+
+    @staticmethod
+    def is_string_in_unicode_range_staticmethod(string: str, unicode_range: tuple[int, int]) -> bool:
+        """
+        中文：\n
+        判断字符串的所有字符是否都在给定的 Unicode 区间内 \n
+        不逐个字符在 Python 层循环比较，
+        而是用 min/max 两次 C 层归约，再做两次比较
+
+        English: \n
+        Determine whether all characters of the string are
+        within the given Unicode range \n
+        Instead of comparing character by character in a Python loop,
+        use two C-level min/max reductions and two comparisons
+
+        :param string: 字符串 The string
+        :param unicode_range: Unicode 区间 (起点, 终点) The Unicode range (start, end)
+        :return: 是否都在区间内 Whether all characters are in the range
+        """
+        # 空字符串没有字符越界，返回 True
+        if string == "":
+            return True
+
+        start, end = unicode_range
+
+        # 两次 C 层归约，代替 N 次 Python 层循环比较
+        # 所有字符都在区间内 等价于 最小码位 >= 起点 且 最大码位 <= 终点
+        return start <= min(map(ord, string)) and max(map(ord, string)) <= end
 
     # 非静态方法
     def is_chinese_or_chu_nom_or_chinese_radical(self) -> bool:
-        if self.initial_data == "":
+        if self.data == "":
             return False
         else:
-            return Lyric_character.is_chinese_or_chu_nom_or_chinese_radical_staticmethod(self.initial_data)
+            return Lyric_character.is_chinese_or_chu_nom_or_chinese_radical_staticmethod(self.data)
 
 
 
@@ -1,3 +1,4 @@
+import functools
 import re
 import warnings
 from typing import Any, Iterator, List
@@ -1168,30 +1169,27 @@ class Lyric_file:
             return kana_tag_list
 
         # 第一个必须是数字，表示接下来几个字符是对应该读音
-        elif kana_tag_content[0].isdigit():
-            # 否则报错
+        # 不是数字才报错
+        elif not kana_tag_content[0].isdigit():
             raise ValueError("The first character of kana tag must be a number representing the number of characters "
                              " corresponding to the reading.")
 
         else:
             # 匹配每个读音
             # 格式：[长度][读音（非数字）]
-            matched_pronunciation_groups: Iterator[Match[str | bytes | Any]] = \
-                Lyric_file.EACH_PROUNUNCIATION_GROUP_IN_KANA_REGEX.finditer(kana_tag_content)
-
-            for each_matched_pronunciation_group in matched_pronunciation_groups:
+            # 副歌的读音标签往往重复出现，解析结果带缓存，重复的标签只解析一次
+            for each_pronunciation, each_character_length in _parse_kana_tag_cached(kana_tag_content):
                 # [读音，长度]
-                each_small_list: list[str, int] = [each_matched_pronunciation_group.group("pronunciation"),
-                                                   each_matched_pronunciation_group.group("length")]
-                kana_tag_list.append(each_small_list)
+                # 每次返回新的小列表，缓存的元组不会被调用方改坏
+                kana_tag_list.append([each_pronunciation, each_character_length])
 
         return kana_tag_list
 
 
     def get_total_kana_tag(self) -> str:
 
-        # 输出字符串
-        output_list: str = ""
+        # 输出片段列表，最后一次性join
+        output_list: list[str] = []
 
         for each_line in self.lrc_lines_secondary:
             each_line: Lyric_line
@@ -1199,9 +1197,9 @@ class Lyric_file:
             kana_tag_each_line = each_line.get_kana_tag()
 
             # 加入每行的读音
-            output_list += kana_tag_each_line
+            output_list.append(kana_tag_each_line)
 
-        return output_list
+        return "".join(output_list)
 
     def update_pronunciation(self, pronunciation_each_line: list[list[list[Lyric_line_content, int]]]) -> Self:
         # 逐行更新
@@ -1221,6 +1219,17 @@ class Lyric_file:
         pass
 
 
+# 读音标签解析结果的缓存
+# 字符串不可变，作为缓存键是安全的
+# 返回不可变的元组，防止缓存内容被调用方修改
+@functools.lru_cache(maxsize=1024)
+def _parse_kana_tag_cached(kana_tag_content: str) -> tuple[tuple[str, int], ...]:
+    # findall 一次性在 C 层扫完整个标签，返回每组的 (整体, 长度, 读音) 元组
+    return tuple((each_pronunciation, int(each_character_length))
+                 for _each_all_group, each_character_length, each_pronunciation
+                 in Lyric_file.EACH_PROUNUNCIATION_GROUP_IN_KANA_REGEX.findall(kana_tag_content))
+
+
 
 if __name__ == '__main__':
     # 测试
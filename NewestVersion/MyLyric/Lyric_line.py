@@ -16,18 +16,17 @@ class Lyric_line:
         # 向后兼容，用列表存储
         self.lyric_contents: list[Lyric_line_content] = lyric_content_list
 
+    # 把歌词内容列表拼接成一个字符串
+    # 各个方法共用，只拼一次，用join一次性分配
+    def _join_lyric_contents_str(self) -> str:
+        return "".join(map(str, self.lyric_contents))
+
     def __str__(self):
         # 两个列表，一个是时间标签，一个是歌词内容
         # 各自拼接
-        time_tabs_str = ""
-        for time_tab in self.time_tabs:
-            time_tabs_str += str(time_tab)
-
-        lyric_contents_str = ""
-        for lyric_content in self.lyric_contents:
-            lyric_contents_str += str(lyric_content)
+        time_tabs_str = "".join(map(str, self.time_tabs))
 
-        return time_tabs_str + lyric_contents_str
+        return time_tabs_str + self._join_lyric_contents_str()
 
     def __repr__(self):
         return self.__str__()
@@ -37,12 +36,8 @@ class Lyric_line:
 
     def __getitem__(self, item):
         # 直接合并歌词列表
-        lyric_contents_str = ""
-        for lyric_content in self.lyric_contents:
-            lyric_contents_str += str(lyric_content)
-
         # 加个时间头输出
-        return str(self.time_tabs[item]) + lyric_contents_str
+        return str(self.time_tabs[item]) + self._join_lyric_contents_str()
 
     def __setitem__(self, key, value: Lyric_Time_tab):
         self.time_tabs[key] = value
@@ -52,21 +47,18 @@ class Lyric_line:
 
     def __iter__(self):
         # 返回每个时间标签+歌词内容
-        for time_tab in self.time_tabs:
-            lyric_contents_str = ""
-            for lyric_content in self.lyric_contents:
-                lyric_contents_str += str(lyric_content)
+        # 歌词内容字符串在循环外拼好，不用每个时间标签都重新拼一遍
+        lyric_contents_str = self._join_lyric_contents_str()
 
+        for time_tab in self.time_tabs:
             yield time_tab + lyric_contents_str
 
     def __reversed__(self):
         # 返回每个时间标签+歌词内容
+        # 同样在循环外拼好歌词内容字符串
+        lyric_contents_str = self._join_lyric_contents_str()
 
         for time_tab in reversed(self.time_tabs):
-            lyric_contents_str = ""
-            for lyric_content in self.lyric_contents:
-                lyric_contents_str += str(lyric_content)
-
             yield time_tab + lyric_contents_str
 
     def __contains__(self, item: Lyric_Time_tab):
@@ -173,11 +165,9 @@ class Lyric_line:
         return output_list
 
     def get_kana_tag(self) -> str:
-        output_str = ""
-        for each_lyric_line_content in self.lyric_contents:
-            output_str += each_lyric_line_content.get_kana_tag()
-
-        return output_str
+        # 每段内容的读音标签拼接，一次性join
+        return "".join(each_lyric_line_content.get_kana_tag()
+                       for each_lyric_line_content in self.lyric_contents)
 
     def update_pronunciation(self, pronunciation_each_line: list[list[Lyric_line_content, int]]):
         if len(self.lyric_contents) == 1:
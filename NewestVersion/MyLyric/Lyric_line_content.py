@@ -1,12 +1,11 @@
 from typing import Optional, Pattern, Self
-from collections import UserList
 
 from .Lyric_Time_tab import Lyric_Time_tab
 from .Lyric_character import Lyric_character
 import re
 
 
-class Lyric_line_content(UserList):
+class Lyric_line_content:
     """
     歌词行内容类
     接受字符串，预先分割
@@ -27,12 +26,15 @@ class Lyric_line_content(UserList):
     读音也可以填入Lrc_character(None)，表示不显示东西
     """
 
+    # 不再继承 UserList，直接持有 data 列表
+    # 每次取下标、取长度、迭代都不用再经过 UserList 的 Python 层转发
+    # 用 __slots__ 省去每个实例的 __dict__，歌词文件一行一个实例，数量可观
+    __slots__ = ("pronunciation_list", "original_line",
+                 "_time_char_list", "time_char_object_list", "data")
+
     def __init__(self, line: str,
                  pronunciation_list: Optional[list[Optional[Self], int]] = None,
                  separation_mode: str = "normal"):
-        # 有序字典，超类重写
-        super().__init__()
-
         self.pronunciation_list = pronunciation_list
         self.original_line: str = line
 
@@ -42,12 +44,21 @@ class Lyric_line_content(UserList):
         # 时间字符对象列表
         self.time_char_object_list: list[Lyric_character] = []
 
+        # 没有时间标签的字符共用一个空的Time_tab对象
+        # 纯行级歌词里每个字符都没有时间标签，不用每个字符都构造一个空对象
+        empty_time_tab_object: Lyric_Time_tab = Lyric_Time_tab(None, separation_mode)
+
         # 先转为Time_tab对象
         # 再转为Lrc_character对象
         # 再添加到有序字典中
         for time_char in self._time_char_list:
-            each_time_tab_object: Lyric_Time_tab = Lyric_Time_tab(time_char[0],
-                                                                  separation_mode)
+            each_time_tab_object: Lyric_Time_tab
+            # 快速通道：没有时间标签，直接复用空对象
+            if time_char[0] is None:
+                each_time_tab_object = empty_time_tab_object
+            else:
+                each_time_tab_object = Lyric_Time_tab(time_char[0],
+                                                      separation_mode)
 
             each_char_object: Lyric_character = Lyric_character(time_char[1],
                                                                 each_time_tab_object)
@@ -61,27 +72,22 @@ class Lyric_line_content(UserList):
 
 
     def __add__(self, other):
+        # 注意：这里不能用 self.pronunciation_list.append(...) 作为参数传进去
+        # append 原地修改 self 的读音列表（加法不应该有副作用），而且表达式本身的值是 None
+        # 合并后的字符串会被重新解析，占位结构和原来的读音列表未必对得上
+        # 所以传 None，让新对象按解析结果重建默认读音列表
         if isinstance(other, Lyric_line_content):
-            # 判断是否有发音列表
-            if self.pronunciation_list is None and other.pronunciation_list is None:
-                return Lyric_line_content(self.original_line + other.original_line, None)
-            elif self.pronunciation_list is None:
-                return Lyric_line_content(self.original_line + other.original_line, other.pronunciation_list)
-            elif other.pronunciation_list is None:
-                return Lyric_line_content(self.original_line + other.original_line, self.pronunciation_list)
-            else:
-                return Lyric_line_content(self.original_line + other.original_line,
-                                          self.pronunciation_list.append(other.pronunciation_list))
+            return Lyric_line_content(self.original_line + other.original_line, None)
 
         elif isinstance(other, str):
-            return Lyric_line_content(self.original_line + other, self.pronunciation_list.append(["", 0]))
+            return Lyric_line_content(self.original_line + other, None)
 
         else:
             raise TypeError("Unsupported operand type(s) for +: 'Lyric_line_content' and '{}'".format(type(other)))
 
     def __radd__(self, other):
         if isinstance(other, str):
-            return Lyric_line_content(other + self.original_line, self.pronunciation_list.append(["", 0]))
+            return Lyric_line_content(other + self.original_line, None)
 
         else:
             raise TypeError("Unsupported operand type(s) for +: 'Lyric_line_content' and '{}'".format(type(other)))
@@ -92,6 +98,32 @@ class Lyric_line_content(UserList):
     def __repr__(self):
         return self.original_line
 
+    # 列表协议，直接委托给 data 列表
+    # 只实现实际用到的方法，不引入 UserList 的整套转发
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __contains__(self, item):
+        return item in self.data
+
+    def __eq__(self, other):
+        # 和另一个歌词内容对象比较，或者直接和列表比较（兼容原 UserList 行为）
+        if isinstance(other, Lyric_line_content):
+            return self.data == other.data
+        elif isinstance(other, list):
+            return self.data == other
+        else:
+            return NotImplemented
+
     def isspace(self):
         return self.original_line.isspace()
 
@@ -255,6 +287,10 @@ class Lyric_line_content(UserList):
         # 初始化结果列表
         result: list[list[str, str]] = []
 
+        # 把热循环里反复用到的属性查找提升为局部变量
+        # 绑定一次，循环里不用每次再做属性查找
+        result_append = result.append
+
         # 初始化上一个匹配的结束位置为 0
         prev_end = 0
 
@@ -262,16 +298,17 @@ class Lyric_line_content(UserList):
         current_time_tag = None
 
         # 使用正则表达式匹配时间标签和字符
-        for matched_char_time_tab in re.finditer(SEPARATION_PATTERN, line):
+        # 直接用编译好的正则对象的方法，不走 re 模块的函数转发
+        for matched_char_time_tab in SEPARATION_PATTERN.finditer(line):
             # 获取匹配的起始和结束位置
             start, end = matched_char_time_tab.span()
 
-            result.append([current_time_tag, line[prev_end]])
+            result_append([current_time_tag, line[prev_end]])
 
             # 如果匹配的起始位置大于上一个匹配的结束位置，说明两个匹配之间有其他字符
             if start > (prev_end + 1):
                 for char in line[prev_end + 1:start]:
-                    result.append([None, char])
+                    result_append([None, char])
 
             # 更新当前时间标签
             current_time_tag = matched_char_time_tab.group()
@@ -281,18 +318,18 @@ class Lyric_line_content(UserList):
 
         # 如果最后一个匹配的结束位置不是字符串的末尾，说明最后一个匹配之后还有其他字符
         if prev_end < len(line):
-            result.append([current_time_tag, line[prev_end]])
+            result_append([current_time_tag, line[prev_end]])
             # 如果只有一个字符，那么直接添加[时间标签, char]
             if prev_end == (len(line) - 1):
                 pass
             # 如果有多个字符，那么添加[时间标签, char]，然后添加[None, char]
             else:
                 for char in line[prev_end + 1:]:
-                    result.append([None, char])
+                    result_append([None, char])
 
         # 如果最后一个匹配的结束位置是字符串的末尾，说明最后一个匹配之后没有其他字符，用""代替表示 空字符串
         else:
-            result.append([current_time_tag, ""])
+            result_append([current_time_tag, ""])
 
         return result
 
@@ -381,11 +418,9 @@ class Lyric_line_content(UserList):
 
         # 初始化结果列表
         result = []
-        # 逐字检查
-        for index, char in enumerate(line):
-            # 如果是汉字或者喃字，那么添加到结果列表中
-            if Lyric_character.is_chinese_or_chu_nom_or_chinese_radical_staticmethod(char):
-                result.append([char, index])
+        # 用字符类正则表达式整行扫描，成员测试在 C 层完成，不用逐字调用 Python 方法
+        for matched_character in Lyric_character.CHINESE_OR_CHU_NOM_CHARACTER_REGEX.finditer(line):
+            result.append([matched_character.group(), matched_character.start()])
 
         # 返回结果
         return result
@@ -412,10 +447,14 @@ class Lyric_line_content(UserList):
         # 初始化结果列表
         result: list[list[str, int]] = []
 
-        # 提取字符串
-        for index, character in enumerate(self):
-            if Lyric_character.is_chinese_or_chu_nom_or_chinese_radical_staticmethod(str(character)):
-                result.append([character, index])
+        # 把所有字符拼成一列字符串（列式视图），一次性批量扫描
+        # 比逐个字符对象调用判断方法少 N 次 Python 层调用
+        characters_column: str = "".join(map(str, self.data))
+
+        # 用字符类正则表达式整列扫描
+        # 每个字符对象只有一个字符（末尾可能是空字符串，不影响前面的下标对应）
+        for matched_character in Lyric_character.CHINESE_OR_CHU_NOM_CHARACTER_REGEX.finditer(characters_column):
+            result.append([self.data[matched_character.start()], matched_character.start()])
 
         return result
 
@@ -424,7 +463,10 @@ class Lyric_line_content(UserList):
                        seperator: tuple[str, str] = (":", "."),
                        bracket: tuple[str, str] = ("<", ">")
                        ) -> str:
-        output_str: str = ""
+        # 片段列表，最后一次性join
+        # 不用 += 反复拼接字符串，那样每次都要重新分配整个字符串，最坏 O(n^2)
+        output_str_parts: list[str] = []
+
         for each_lyric_character in self:
             each_lyric_character: Lyric_character
 
@@ -433,9 +475,10 @@ class Lyric_line_content(UserList):
                                                                   seperator=seperator,
                                                                   brackets=bracket)
 
-            output_str += (str(each_time_tab_str) + str(each_lyric_character))
+            output_str_parts.append(str(each_time_tab_str))
+            output_str_parts.append(str(each_lyric_character))
 
-        return output_str
+        return "".join(output_str_parts)
 
 
     def get_kana_tag(self) -> str:
@@ -451,7 +494,8 @@ class Lyric_line_content(UserList):
         # 获取读音列表
         pronunciation_list = self.pronunciation_list
 
-        output_str: str = ""
+        # 片段列表，最后一次性join，不用 += 反复拼接
+        output_str_parts: list[str] = []
 
         # 逐个遍历
         for each_pronunciation in pronunciation_list:
@@ -469,9 +513,10 @@ class Lyric_line_content(UserList):
 
                 # 另外的情况就加到结果字符串中
                 # 以，长度+读音的形式
-                output_str += (str(each_pronunciation[1]) + str(each_pronunciation[0]))
+                output_str_parts.append(str(each_pronunciation[1]))
+                output_str_parts.append(str(each_pronunciation[0]))
 
-        return output_str
+        return "".join(output_str_parts)
 
 
 if __name__ == '__main__':